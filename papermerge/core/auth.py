@@ -483,10 +483,7 @@ class NodeAuthBackend:
                 node_id__in=obj_ids
             )
             for access in all_access_items:
-                if not access.group:
-                    continue
-
-                if user_obj.groups.filter(name=access.group.name).exists():
+                if self._is_user_group(user_obj, access.group_id):
                     ret[access.node_id] = {
                         perm.codename for perm in access.permissions.all()
                     }
@@ -496,14 +493,31 @@ class NodeAuthBackend:
         # else -> case when obj_or_list is a single object
 
         for access in obj_or_list.access_set.filter(access_type=access_type):
-            if not access.group:
-                continue
-
-            if user_obj.groups.filter(name=access.group.name).exists():
+            if self._is_user_group(user_obj, access.group_id):
                 return {perm.codename for perm in access.permissions.all()}
 
         return set()
 
+    def _is_user_group(self, user_obj, group_id):
+        """
+        Returns True if user is member of given group.
+
+        IDs of user's groups are fetched only when an access entry
+        of some group is checked and then cached on user_obj (as django's
+        permissions are), i.e. there is one query per user instead of
+        one query per access entry.
+        """
+        if group_id is None:
+            # user access entry
+            return False
+
+        if not hasattr(user_obj, '_group_ids_cache'):
+            user_obj._group_ids_cache = frozenset(
+                user_obj.groups.values_list('id', flat=True)
+            )
+
+        return group_id in user_obj._group_ids_cache
+
     def _get_user_permissions(self, user_obj, obj_or_list, access_type):
         if not isinstance(obj_or_list, models.Model):
             if len(obj_or_list) == 0:
@@ -1,15 +1,22 @@
-from os.path import getsize, basename
+import os
+import functools
+from io import BytesIO
+from os.path import basename
 import logging
-from magic import from_file
+import mimetypes
+from magic import Magic
 from tempfile import _TemporaryFileWrapper
 
 from django.core.files.temp import NamedTemporaryFile
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.signals import setting_changed
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import module_loading
 
-from .lib.pagecount import get_pagecount
+from .lib.pagecount import get_pagecount, get_buffer_pagecount
 from .exceptions import FileTypeNotSupported
 
 from papermerge.core.models import (
@@ -26,6 +33,86 @@ WEB = "WEB"
 IMAP = "IMAP"
 LOCAL = "LOCAL"
 
+# Creating a libmagic cookie loads and compiles the whole magic database,
+# thus it is done only once per process. ``Magic`` serializes access to the
+# cookie with its own lock, so the instance can be shared between threads.
+_MIME_DETECTOR = Magic(mime=True)
+# All supported file types (pdf, tiff, jpeg, png) are identified
+# by libmagic from the first few KB of the file
+MIME_HEADER_SIZE = 8192
+# Leading bytes of supported file types. Mimetype guessed from the file
+# name is trusted only if the payload starts with one of these.
+_FILE_SIGNATURES = {
+    'application/pdf': (b'%PDF-',),
+    'image/png': (b'\x89PNG\r\n\x1a\n',),
+    'image/jpeg': (b'\xff\xd8\xff',),
+    'image/jpg': (b'\xff\xd8\xff',),
+    'image/tiff': (b'II*\x00', b'MM\x00*'),
+}
+# page count of these mimetypes is found without writing payload to disk
+_BUFFER_PAGECOUNT_MIMETYPES = frozenset(
+    ('application/pdf', 'image/png', 'image/jpeg', 'image/jpg')
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _supported_mimetypes():
+    """
+    Returns a frozenset of ``settings.PAPERMERGE_MIMETYPES``.
+    Setting is read on first use, not at import time.
+    """
+    return frozenset(settings.PAPERMERGE_MIMETYPES)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_superuser_id():
+    """
+    Returns ID of the first superuser i.e. of the owner of imported documents
+    when no owner is specified.
+
+    Raises ``User.DoesNotExist`` if there is no superuser; as exceptions
+    are not cached, superuser created later on will be found.
+    """
+    user_id = User.objects.filter(
+        is_superuser=True
+    ).values_list('id', flat=True).first()
+
+    if user_id is None:
+        raise User.DoesNotExist("No superuser found")
+
+    return user_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _inbox_id_for(user_id):
+    """
+    Returns ID of the inbox folder of the user with given ID
+    """
+    inbox, _ = Folder.objects.get_or_create(
+        title=Folder.INBOX_TITLE,
+        parent=None,
+        user_id=user_id
+    )
+    return inbox.id
+
+
+def clear_user_properties_cache():
+    """
+    Forgets cached default superuser and inbox folder IDs.
+
+    Users and folders are usually changed by web workers i.e. outside
+    of the long running importer process, thus importers call this
+    function at the start of each import run.
+    """
+    _default_superuser_id.cache_clear()
+    _inbox_id_for.cache_clear()
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver(post_delete, sender=Folder)
+def _clear_user_properties_cache(sender, **kwargs):
+    clear_user_properties_cache()
+
 
 class DefaultPipeline:
     """
@@ -41,6 +128,7 @@ class DefaultPipeline:
         payload=None,
         doc=None,
         processor=WEB,
+        name=None,
         **kwargs
     ):
         """
@@ -48,19 +136,26 @@ class DefaultPipeline:
         with the pipeline.
 
         Args:
-            payload (Union[bytes, TemporaryUploadedFile,
-            _TemporaryFileWrapper], optional): payload to be ingested.
+            payload (Union[bytes, BytesIO, TemporaryUploadedFile,
+            _TemporaryFileWrapper], optional): payload to be ingested;
+            bytes are wrapped in BytesIO and kept in memory.
             Defaults to None. doc (Document, optional): document to be
             updated. Defaults to None. processor (str, optional): from which
-            importer this class is invocated. Defaults to WEB.
+            importer this class is invocated. Defaults to WEB. name (str,
+            optional): original file name of the payload, used to guess its
+            mimetype from extension. Defaults to None.
 
         Raises:
             TypeError: raised when payload is not a supported file object
             FileTypeNotSupported: raised when payload is of a wrong mimetype
-            for the pipeline
+            for the pipeline or when payload for existing document
+            is not a PDF file
         """
         self.processor = processor
         self.doc = doc
+        self.name = name
+        self.mimetype = None
+        self._temp = None
 
         if payload is None:
             raise TypeError
@@ -73,44 +168,106 @@ class DefaultPipeline:
             self.path = payload.temporary_file_path()
         elif isinstance(payload, _TemporaryFileWrapper):
             self.path = payload.name
+        elif isinstance(payload, BytesIO):
+            # written to disk only if needed, see ``path`` property
+            self.path = None
         else:
             raise TypeError
 
         self.check_mimetype()
+        if doc is not None and self.mimetype != 'application/pdf':
+            # new version of existing document can be only a PDF file,
+            # see ``Document.upload``
+            raise FileTypeNotSupported
+
+    @property
+    def path(self):
+        """Filesystem path of the payload. In-memory payload is written
+        to a temporary file on first access.
+        """
+        if self._path is None:
+            self._path = self.spill_temp()
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        self._path = value
 
     def check_mimetype(self):
         """Check if mimetype of the document to be imported is supported
-        by Papermerge or one of its apps.
+        by Papermerge or one of its apps. Mimetype guessed from file
+        extension is accepted only if the payload header starts with
+        the signature of that file type; in all other cases mimetype
+        is detected by libmagic from the payload header.
+
+        Detected mimetype is stored in ``self.mimetype``.
 
         Raises:
             FileTypeNotSupported: If the mimetype is not supported by this
             pipeline
 
         """
-        supported_mimetypes = settings.PAPERMERGE_MIMETYPES
-        mime = from_file(self.path, mime=True)
-        if mime in supported_mimetypes:
+        header = self.read_header()
+        name = self.name or self._path
+        if name:
+            guess, _ = mimetypes.guess_type(name)
+            if (
+                guess in _supported_mimetypes() and
+                header.startswith(_FILE_SIGNATURES.get(guess, ()))
+            ):
+                self.mimetype = guess
+                return None
+
+        mime = _MIME_DETECTOR.from_buffer(header)
+        if mime in _supported_mimetypes():
+            self.mimetype = mime
             return None
         raise FileTypeNotSupported
 
+    def read_header(self):
+        """Read the first ``MIME_HEADER_SIZE`` bytes of the payload.
+
+        Payload is already an open file object, thus it is read directly
+        instead of opening the file again by path. File position is
+        restored afterwards.
+
+        Returns:
+            bytes: header of the payload
+        """
+        position = self.payload.tell()
+        self.payload.seek(0)
+        header = self.payload.read(MIME_HEADER_SIZE)
+        self.payload.seek(position)
+        return header
+
     def write_temp(self, payload):
-        """Write a temporary file to disk, necessary for certain
-        payload types that are not stored on file.
+        """Wrap payload types that are not stored on file into an
+        in-memory file object. Payload is written to disk only
+        if a filesystem path is really needed, see ``spill_temp``.
 
         Args:
             payload (bytes): ingested payload
 
         Returns:
-            temp (NamedTemporaryFile): temporary file on disk
+            temp (BytesIO): in-memory file object
+        """
+        return BytesIO(payload)
+
+    def spill_temp(self):
+        """Write in-memory payload to a temporary file on disk.
+
+        Returns:
+            path (str): path of the temporary file
         """
         logger.debug(
             f"{self.processor} importer: creating temporary file"
         )
 
         temp = NamedTemporaryFile()
-        temp.write(payload)
+        temp.write(self.payload.getvalue())
         temp.flush()
-        return temp
+        self._temp = temp
+        return temp.name
 
     @staticmethod
     def get_user_properties(user):
@@ -123,34 +280,61 @@ class DefaultPipeline:
         Returns:
             user (User): owner object
             lang (str): user language
-            inbox (Folder): inbox folder
+            inbox_id (UUID): ID of the inbox folder
         """
         if user is None:
-            user = User.objects.filter(
-                is_superuser=True
-            ).first()
+            user = User.objects.get(pk=_default_superuser_id())
         if isinstance(user, str):
             user = User.objects.filter(
                 username=user
             ).first()
-        lang = user.preferences['ocr__OCR_Language']
+        lang = user.prefs['ocr__language']
 
-        inbox, _ = Folder.objects.get_or_create(
-            title=Folder.INBOX_TITLE,
-            parent=None,
-            user=user
-        )
-        return user, lang, inbox
+        return user, lang, _inbox_id_for(user.id)
+
+    def move_tempfile(self, document_version):
+        """Store the payload as file of given document version"""
+        if isinstance(self.payload, BytesIO):
+            default_storage.write_doc(
+                content=self.payload.getvalue(),
+                dst=document_version.document_path.url
+            )
+            return None
 
-    def move_tempfile(self, doc):
-        default_storage.copy_doc(
+        default_storage.link_doc(
             src=self.path,
-            dst=doc.path().url()
+            dst=document_version.document_path.url,
+            file_permissions_mode=settings.FILE_UPLOAD_PERMISSIONS
         )
         return None
 
     def page_count(self):
-        return get_pagecount(self.path)
+        if (
+            isinstance(self.payload, BytesIO) and
+            self.mimetype in _BUFFER_PAGECOUNT_MIMETYPES
+        ):
+            return get_buffer_pagecount(
+                self.payload,
+                mime_type=self.mimetype
+            )
+        return get_pagecount(self.path, mime_type=self.mimetype)
+
+    def _probe(self):
+        """Collect size and page count of the payload.
+
+        Size is taken from the in-memory payload, from the size counted
+        by Django while the upload was streamed to disk or from the already
+        open payload file descriptor and page count reuses the mimetype
+        found by ``check_mimetype``, so that the payload is neither stat-ed
+        by path nor sniffed again.
+        """
+        if isinstance(self.payload, BytesIO):
+            self._size = self.payload.getbuffer().nbytes
+        elif isinstance(self.payload, TemporaryUploadedFile):
+            self._size = self.payload.size
+        else:
+            self._size = os.fstat(self.payload.fileno()).st_size
+        self._page_count = self.page_count()
 
     def get_init_kwargs(self):
         """Propagates keyword arguments to use in the init method
@@ -208,73 +392,105 @@ class DefaultPipeline:
             Document: the created or updated document
         """
         if parent is None:
-            user, lang, inbox = self.get_user_properties(user)
+            user, lang, inbox_id = self.get_user_properties(user)
             # in case of upload via REST API, LOCAL, or IMAP interface,
             # documents must land in user's inbox
             if self.processor in (REST_API, LOCAL, IMAP):
-                parent = inbox.id
+                parent = inbox_id
         if name is None:
-            name = basename(self.path)
-        page_count = self.page_count()
-        size = getsize(self.path)
-        version = 0
-        target_version = 1
+            name = self.name or basename(self.path)
 
         if create_document and self.doc is None:
+            self._probe()
             try:
                 doc = Document.objects.create_document(
-                    user=user,
+                    user_id=user.pk,
                     title=name,
-                    size=size,
-                    lang=lang,
+                    lang=lang or user.prefs['ocr__language'],
                     file_name=name,
-                    parent_id=parent,
-                    page_count=page_count,
-                    notes=notes
+                    parent_id=parent
                 )
                 self.doc = doc
             except ValidationError as error:
                 logger.error(f"{self.processor} importer: validation failed")
                 raise error
+            document_version = doc.versions.last()
+            document_version.size = self._size
+            document_version.page_count = self._page_count
+            document_version.save(update_fields=['size', 'page_count'])
+            document_version.create_pages()
+            self.move_tempfile(document_version)
         elif self.doc is not None:
             doc = self.doc
-            version = doc.version
-            target_version = doc.version + 1
-            doc.version = target_version
-            doc.page_count = page_count
-            doc.file_name = name
-            doc.size = size
-            doc.save()
-            try:
-                doc.recreate_pages()
-            except ValueError:
-                doc.create_pages()
-            doc.full_clean()
+            # version, size, page count and file name are attributes of
+            # document version: only a (new) document version row is
+            # written, document row itself stays untouched.
+            # ``upload`` stores the payload file as well.
+            self.payload.seek(0)
+            # payload's file is temporary, thus it is linked, not copied;
+            # in-memory payload is stored without writing it to
+            # a temporary file first
+            doc.upload(
+                payload=self.payload,
+                file_path=self._path,
+                file_name=name,
+                link=True
+            )
+            document_version = doc.versions.last()
 
-        self.move_tempfile(doc)
         self.payload.close()
+        if self._temp is not None:
+            self._temp.close()
         if not skip_ocr:
 
             namespace = default_storage.upload(
-                doc_path_url=doc.path().url()
+                doc_path_url=document_version.document_path.url
             )
 
             if namespace is None:
                 namespace = ''
             ocr_document_task.apply_async(kwargs={
-                'user_id': user.id,
-                'document_id': doc.id,
-                'file_name': name,
-                'lang': lang,
-                'namespace': namespace,
-                'version': version,
-                'target_version': target_version
+                'user_id': str(doc.user_id),
+                'document_id': str(doc.id),
+                'lang': doc.lang,
+                'namespace': namespace
             })
 
         logger.debug(f"{self.processor} importer: import complete.")
         return doc
 
 
+@functools.lru_cache(maxsize=1)
+def _resolved_pipelines():
+    """
+    Returns a tuple of pipeline classes listed in
+    ``settings.PAPERMERGE_PIPELINES``. Pipelines are resolved once per
+    process, pipelines which could not be imported are logged and left out.
+    """
+    pipeline_classes = []
+
+    for pipeline in settings.PAPERMERGE_PIPELINES:
+        try:
+            pipeline_classes.append(
+                module_loading.import_string(pipeline)
+            )
+        except ImportError:
+            logger.error(
+                f"{pipeline} could not be loaded."
+                " Check if it is installed properly."
+            )
+
+    return tuple(pipeline_classes)
+
+
+@receiver(setting_changed)
+def _clear_settings_cache(setting, **kwargs):
+    if setting == 'PAPERMERGE_MIMETYPES':
+        _supported_mimetypes.cache_clear()
+    elif setting == 'PAPERMERGE_PIPELINES':
+        _resolved_pipelines.cache_clear()
+
+
 def go_through_pipelines(init_kwargs, apply_kwargs):
     """
     Method to go through all the loaded pipelines **in order**. The init and
@@ -291,19 +507,9 @@ def go_through_pipelines(init_kwargs, apply_kwargs):
     """
     processor = init_kwargs.get('processor', WEB)
     doc = None
-    pipelines = settings.PAPERMERGE_PIPELINES
     logger.info(f"{processor} importer: importing file")
 
-    for pipeline in pipelines:
-
-        try:
-            pipeline_class = module_loading.import_string(pipeline)
-        except ImportError:
-            logger.error(
-                f"{pipeline} could not be loaded."
-                " Check if it is installed properly."
-            )
-            continue
+    for pipeline_class in _resolved_pipelines():
         try:
             importer = pipeline_class(**init_kwargs)
         except TypeError:
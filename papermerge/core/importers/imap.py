@@ -9,7 +9,11 @@ from email.message import EmailMessage
 
 from django.db.models import Q
 
-from papermerge.core.import_pipeline import IMAP, go_through_pipelines
+from papermerge.core.import_pipeline import (
+    IMAP,
+    clear_user_properties_cache,
+    go_through_pipelines
+)
 from papermerge.core.models import User
 
 
@@ -66,7 +70,11 @@ def trigger_document_pipeline(
             payload = part.get_content()
         except KeyError:
             continue
-        init_kwargs = {'payload': payload, 'processor': IMAP}
+        init_kwargs = {
+            'payload': payload,
+            'processor': IMAP,
+            'name': part.get_filename()
+        }
         apply_kwargs = {
             'user': user,
             'name': part.get_filename(),
@@ -357,6 +365,7 @@ def import_attachment(
         return
 
     imap_client = select_inbox(imap_client, inbox_name)
+    clear_user_properties_cache()
 
     for email_message in email_iterator(imap_client, delete=delete):
         user = get_matching_user(
@@ -1,15 +1,26 @@
 import os
 import time
 import logging
-from hashlib import blake2b
 
 from django.conf import settings
 
-from papermerge.core.import_pipeline import LOCAL, go_through_pipelines
+from papermerge.core.import_pipeline import (
+    LOCAL,
+    clear_user_properties_cache,
+    go_through_pipelines
+)
 
 logger = logging.getLogger(__name__)
 
 
+def get_file_signature(stat_result):
+    """
+    Returns a tuple which changes whenever file content is modified
+    i.e. file's size and modification time (in nanoseconds).
+    """
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
 def import_documents(directory, skip_ocr=False):
     files = []
 
@@ -18,11 +29,9 @@ def import_documents(directory, skip_ocr=False):
 
     for entry in os.scandir(directory):
         if entry.is_file():
-            with open(entry.path, 'rb') as file_handler:
-                file_hash = blake2b()
-                file_bytes = file_handler.read()
-                file_hash.update(file_bytes)
-            file_tuple = (entry.path, file_hash.digest())
+            # only file's stat info (size and mtime) is taken here,
+            # file content is not read until the file is consumed
+            file_tuple = (entry.path, get_file_signature(entry.stat()))
             files.append(file_tuple)
         else:
             logger.warning(
@@ -34,17 +43,21 @@ def import_documents(directory, skip_ocr=False):
         return
 
     time.sleep(int(settings.PAPERMERGE_FILES_MIN_UNMODIFIED_DURATION))
+    clear_user_properties_cache()
 
-    for file_path, file_hash in files:
+    for file_path, file_signature in files:
         with open(file_path, 'rb') as file_handler:
-            file_bytes = file_handler.read()
-            file_hash_new = blake2b()
-            file_hash_new.update(file_bytes)
-            if not file_hash == file_hash_new.digest():
+            file_stat = os.fstat(file_handler.fileno())
+            if not file_signature == get_file_signature(file_stat):
                 continue
             # File has not been modified and can be consumed
+            file_bytes = file_handler.read()
             basename = os.path.basename(file_path)
-            init_kwargs = {'payload': file_bytes, 'processor': LOCAL}
+            init_kwargs = {
+                'payload': file_bytes,
+                'processor': LOCAL,
+                'name': basename
+            }
             apply_kwargs = {'user': None,
                             'name': basename,
                             'skip_ocr': skip_ocr
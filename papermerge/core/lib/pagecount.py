@@ -70,11 +70,13 @@ def _get_tiff_pagecount(filepath):
     return 0
 
 
-def get_pagecount(filepath: str) -> int:
+def get_pagecount(filepath: str, mime_type: str = None) -> int:
     """
     Returns the number of pages in a file given by filepath.
 
     filepath - is filesystem path to a PDF/JPEG/PNG/TIFF document
+    mime_type - mime type of the document, if already known by the caller.
+        When not provided, it is detected with libmagic.
     """
     if not os.path.isfile(filepath):
         raise ValueError("Filepath %s is not a file" % filepath)
@@ -83,7 +85,8 @@ def get_pagecount(filepath: str) -> int:
         raise ValueError("Filepath %s is a directory!" % filepath)
 
     base, ext = os.path.splitext(filepath)
-    mime_type = from_file(filepath, mime=True)
+    if mime_type is None:
+        mime_type = from_file(filepath, mime=True)
     # pure images (png, jpeg) have only one page :)
 
     if mime_type in ['image/png', 'image/jpeg', 'image/jpg']:
@@ -126,6 +129,35 @@ def get_pagecount(filepath: str) -> int:
     return count
 
 
+def get_buffer_pagecount(buffer, mime_type: str) -> int:
+    """
+    Returns the number of pages in a document held in memory.
+
+    buffer - binary file object (e.g. io.BytesIO) with PDF/JPEG/PNG document
+    mime_type - mime type of the document
+
+    TIFF documents are not handled here, as their page count is found
+    by external utility which needs a file on disk; use get_pagecount
+    for them.
+    """
+    if mime_type in ['image/png', 'image/jpeg', 'image/jpg']:
+        return 1
+
+    if mime_type != 'application/pdf':
+        raise FileTypeNotSupported(
+            "Only jpeg, png and pdf are handled by this method"
+        )
+
+    position = buffer.tell()
+    buffer.seek(0)
+    with pikepdf.Pdf.open(buffer) as pdf:
+        count = len(pdf.pages)
+    buffer.seek(position)
+
+    return count
+
+
 __all__ = [
-    get_pagecount
+    get_pagecount,
+    get_buffer_pagecount
 ]
@@ -158,6 +158,57 @@ class Storage:
             self.abspath(dst)
         )
 
+    def link_doc(
+        self,
+        src: DocumentPath,
+        dst: DocumentPath,
+        file_permissions_mode=None
+    ):
+        """
+        hard link given src file path to destination
+        as absolute doc_path
+
+        Meant for temporary src files (e.g. uploaded or imported files)
+        which are deleted afterwards: no file data is copied, dst
+        just becomes another name for src's data. When hard link cannot
+        be created (e.g. src and dst are on different filesystems)
+        falls back to ``copy_doc``.
+
+        Linked file shares mode with src, which for temporary files
+        is usually 0o600. Thus, if ``file_permissions_mode`` is given,
+        dst's mode is set to it (e.g. to FILE_UPLOAD_PERMISSIONS).
+        """
+        self.make_sure_path_exists(
+            self.abspath(dst)
+        )
+        logger.debug(
+            f"link_doc: {src} to {dst}"
+        )
+        try:
+            os.link(
+                self.abspath(src),
+                self.abspath(dst)
+            )
+        except OSError:
+            self.copy_doc(src=src, dst=dst)
+
+        if file_permissions_mode is not None:
+            os.chmod(self.abspath(dst), file_permissions_mode)
+
+    def write_doc(self, content: bytes, dst: DocumentPath):
+        """
+        write given content to destination
+        as absolute doc_path
+        """
+        self.make_sure_path_exists(
+            self.abspath(dst)
+        )
+        logger.debug(
+            f"write_doc: {len(content)} bytes to {dst}"
+        )
+        with open(self.abspath(dst), 'wb') as f:
+            f.write(content)
+
     def exists(self, _path):
         return os.path.exists(
             self.path(_path)
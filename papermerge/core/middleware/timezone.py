@@ -25,7 +25,7 @@ class TimezoneMiddleware:
         if request.user.is_anonymous:
             return self.get_response(request)
 
-        preferences = request.user.preferences
+        preferences = request.user.prefs
         tzname = preferences['localization__timezone']
 
         if tzname:
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.13 on 2026-10-14 22:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='basetreenode',
+            index=models.Index(fields=['user', 'parent', '-created_at'], name='node_user_parent_created_idx'),
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.contrib import auth
 from django.core.exceptions import PermissionDenied
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from papermerge.core.models.automate import Automate
@@ -119,6 +120,19 @@ class User(AbstractUser):
         auto_now=True
     )
 
+    @cached_property
+    def prefs(self):
+        """
+        All user preferences as a dictionary e.g.
+        ``{'ocr__language': 'deu', 'ocr__trigger': 'auto', ...}``.
+
+        Preferences are loaded with a single cache round trip (or a single
+        DB query on cold cache) and memoized on this instance. Use
+        ``user.preferences[...]`` instead when the value is about to be
+        changed, or when a fresh value is required.
+        """
+        return self.preferences.all()
+
     def create_special_folders(self):
         """
         Creates user's home and inbox folders.
@@ -3,6 +3,8 @@ import os
 from os.path import getsize
 from pikepdf import Pdf
 
+from django.conf import settings
+from django.core.files import File
 from django.db import models
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
@@ -257,7 +259,8 @@ class Document(BaseTreeNode):
             payload,
             file_path,
             file_name,
-            strategy=UploadStrategy.INCREMENT
+            strategy=UploadStrategy.INCREMENT,
+            link=False
     ):
         """
         Associates payload with specific document version.
@@ -265,6 +268,13 @@ class Document(BaseTreeNode):
         If document has zero sized documend version, it will associte
         payload with that (existing) version, otherwise it will create
         new document version and associate it the payload.
+
+        By default file at ``file_path`` is copied into the storage.
+        Pass ``link=True`` only if ``file_path`` is a temporary file owned
+        by the caller (and removed afterwards): such file is hard linked
+        instead of copied. In-memory payload (e.g. ``BytesIO``) may be
+        passed with ``file_path=None``, its content is then written
+        into the storage directly.
         """
         pdf = Pdf.open(payload)
 
@@ -278,13 +288,34 @@ class Document(BaseTreeNode):
             )
 
         document_version.file_name = file_name
-        document_version.size = getsize(file_path)
         document_version.page_count = len(pdf.pages)
-
-        get_storage_instance().copy_doc(
-            src=file_path,
-            dst=document_version.document_path
-        )
+        storage = get_storage_instance()
+
+        if file_path is None:
+            content = payload.getvalue()
+            document_version.size = len(content)
+            storage.write_doc(
+                content=content,
+                dst=document_version.document_path
+            )
+        else:
+            if isinstance(payload, File):
+                # size was counted while payload was written to disk
+                document_version.size = payload.size
+            else:
+                document_version.size = getsize(file_path)
+
+            if link:
+                storage.link_doc(
+                    src=file_path,
+                    dst=document_version.document_path,
+                    file_permissions_mode=settings.FILE_UPLOAD_PERMISSIONS
+                )
+            else:
+                storage.copy_doc(
+                    src=file_path,
+                    dst=document_version.document_path
+                )
 
         document_version.save()
         document_version.create_pages()
@@ -333,11 +364,10 @@ class Document(BaseTreeNode):
         )
         os.makedirs(dirname, exist_ok=True)
 
-        dst_pdf.save(abs_path(document_version.document_path.url))
-
-        document_version.size = getsize(
-            abs_path(document_version.document_path.url)
-        )
+        with open(abs_path(document_version.document_path.url), 'wb') as f:
+            dst_pdf.save(f)
+            # file position after save is the size of the written file
+            document_version.size = f.tell()
         document_version.save()
 
         document_version.create_pages()
@@ -1,10 +1,7 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from polymorphic_tree.managers import (
-    PolymorphicMPTTModelManager,
-    PolymorphicMPTTQuerySet
-)
+from polymorphic_tree.managers import PolymorphicMPTTModelManager
 
 from papermerge.core.models.diff import Diff
 from papermerge.core.models.kvstore import (
@@ -14,6 +11,7 @@ from papermerge.core.models.kvstore import (
 )
 from papermerge.core.models.node import (
     BaseTreeNode,
+    NodeQuerySet,
     RELATED_NAME_FMT,
     RELATED_QUERY_NAME_FMT
 )
@@ -23,22 +21,8 @@ class FolderManager(PolymorphicMPTTModelManager):
     pass
 
 
-class FolderQuerySet(PolymorphicMPTTQuerySet):
-
-    def delete(self, *args, **kwargs):
-        for node in self:
-            descendants = node.get_descendants()
-
-            if descendants.count() > 0:
-                descendants.delete(*args, **kwargs)
-            # At this point all descendants were deleted.
-            # Self delete :)
-            try:
-                node.delete(*args, **kwargs)
-            except BaseTreeNode.DoesNotExist:
-                # this node was deleted by earlier recursive call
-                # it is ok, just skip
-                pass
+class FolderQuerySet(NodeQuerySet):
+    pass
 
 
 CustomFolderManager = FolderManager.from_queryset(FolderQuerySet)
@@ -65,14 +49,8 @@ class Folder(BaseTreeNode):
         resource_name = "folders"
 
     def delete(self, *args, **kwargs):
-        descendants = self.basetreenode_ptr.get_descendants()
-
-        if descendants.count() > 0:
-            for node in descendants:
-                try:
-                    node.delete(*args, **kwargs)
-                except BaseTreeNode.DoesNotExist:
-                    pass
+        # each child is deleted together with its own descendants
+        self.basetreenode_ptr.get_children().delete(*args, **kwargs)
         # At this point all descendants were deleted.
         # Self delete :)
         try:
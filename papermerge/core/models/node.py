@@ -38,17 +38,29 @@ class NodeManager(PolymorphicMPTTModelManager):
 class NodeQuerySet(PolymorphicMPTTQuerySet):
 
     def delete(self, *args, **kwargs):
-        for node in self:
-            descendants = node.get_descendants()
+        """
+        Deletes all nodes of the queryset together with their descendants.
 
-            if descendants.count() > 0:
-                descendants.delete(*args, **kwargs)
-            # At this point all descendants were deleted.
-            # Self delete :)
+        Deleting a node deletes its whole subtree, thus only the topmost
+        nodes of the queryset are deleted (one by one, as MPTT tree needs
+        to be updated and delete signals fired for each of them).
+        Nodes within subtree of an already deleted node are skipped.
+        """
+        # tree_id and rght of last deleted node as found in the queryset
+        # i.e. before deletions shifted them. They are copied because
+        # ``node.delete`` refreshes lft/rght of the instance from DB and
+        # these would not be comparable with lft of following nodes.
+        last_tree_id, last_rght = None, None
+
+        for node in self.order_by('tree_id', 'lft'):
+            if node.tree_id == last_tree_id and node.lft < last_rght:
+                # node is descendant of last deleted node
+                continue
+            last_tree_id, last_rght = node.tree_id, node.rght
             try:
                 node.delete(*args, **kwargs)
             except BaseTreeNode.DoesNotExist:
-                # this node was deleted by earlier recursive call
+                # this node was deleted meanwhile
                 # it is ok, just skip
                 pass
 
@@ -111,11 +123,10 @@ class BaseTreeNode(PolymorphicMPTTModel):
         """
         Localize and format datetime instance considering user preferences.
         """
-        tz = pytz.timezone(
-            self.user.preferences['localization__timezone']
-        )
-        fmt = self.user.preferences['localization__date_format']
-        fmt += " " + self.user.preferences['localization__time_format']
+        prefs = self.user.prefs
+        tz = pytz.timezone(prefs['localization__timezone'])
+        fmt = prefs['localization__date_format']
+        fmt += " " + prefs['localization__time_format']
 
         ret_datetime = timezone.localtime(_datetime, timezone=tz)
 
@@ -409,6 +420,14 @@ class BaseTreeNode(PolymorphicMPTTModel):
         verbose_name = _("Documents")
         verbose_name_plural = _("Documents")
         _icon_name = 'basetreenode'
+        indexes = [
+            # node children listing: filter by user and parent,
+            # newest nodes first
+            models.Index(
+                fields=['user', 'parent', '-created_at'],
+                name='node_user_parent_created_idx'
+            ),
+        ]
 
 
 class AbstractNode(models.Model):
@@ -5,10 +5,14 @@ from papermerge.core.models import Folder
 from papermerge.core.models import Document
 
 from .document_version import DocumentVersionSerializer
+from .mixins import UpdateChangedFieldsMixin
 from .tag import ColoredTagListSerializerField
 
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(
+    UpdateChangedFieldsMixin,
+    serializers.ModelSerializer
+):
     size = serializers.IntegerField(required=False)
     page_count = serializers.IntegerField(required=False)
     parent = ResourceRelatedField(queryset=Folder.objects)
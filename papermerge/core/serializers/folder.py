@@ -5,6 +5,7 @@ from rest_framework_json_api.relations import ResourceRelatedField
 from rest_framework_json_api.utils import get_resource_type_from_instance
 
 from papermerge.core.models import Folder
+from .mixins import UpdateChangedFieldsMixin
 from .tag import ColoredTagListSerializerField
 
 
@@ -31,7 +32,10 @@ class NodeRelatedField(ResourceRelatedField):
         ])
 
 
-class FolderSerializer(serializers.ModelSerializer):
+class FolderSerializer(
+    UpdateChangedFieldsMixin,
+    serializers.ModelSerializer
+):
 
     parent = ResourceRelatedField(queryset=Folder.objects)
     tags = ColoredTagListSerializerField(required=False)
@@ -0,0 +1,53 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.utils import model_meta
+
+
+class UpdateChangedFieldsMixin:
+    """
+    A mixin for node serializers which saves only changed columns.
+
+    Regular ``ModelSerializer.update`` sets all validated attributes
+    and then calls ``instance.save()`` which writes all columns of the node
+    (and of its parent table). With this mixin, only columns whose value
+    actually changed (plus ``updated_at``) end up in the UPDATE statement
+    and, if nothing changed, no UPDATE is issued at all.
+    """
+
+    def update(self, instance, validated_data):
+        info = model_meta.get_field_info(instance)
+        m2m_fields = []
+        update_fields = []
+
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                m2m_fields.append((attr, value))
+                continue
+
+            try:
+                field = instance._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # serializer only attribute
+                setattr(instance, attr, value)
+                continue
+
+            # compare raw column values (e.g. parent_id), this way
+            # related instances are not fetched from DB
+            old_value = getattr(instance, field.attname)
+            new_value = value
+            # attribute may be given either as related instance
+            # (e.g. parent) or as raw column value (e.g. parent_id)
+            is_instance = field.is_relation and attr != field.attname
+            if is_instance and value is not None:
+                new_value = value.pk
+            if old_value != new_value:
+                setattr(instance, attr, value)
+                update_fields.append(attr)
+
+        if update_fields:
+            instance.save(update_fields=update_fields + ['updated_at'])
+
+        for attr, value in m2m_fields:
+            field = getattr(instance, attr)
+            field.set(value)
+
+        return instance
@@ -1,3 +1,4 @@
+from django.db import IntegrityError, transaction
 from rest_framework_json_api import serializers
 from taggit.serializers import TagListSerializerField, TagList
 
@@ -21,16 +22,26 @@ class TagSerializer(serializers.ModelSerializer):
     def save(self, **attrs):
         user_id = attrs.get('user_id', None)
         name = self.validated_data['name']
-        try:
-            Tag.objects.get(name=name, user_id=user_id)
-        except Tag.DoesNotExist:
-            pass
-        else:
+        if self._tag_exists(name, user_id):
             raise serializers.ValidationError(
                 f"Tag with name='{name}' already exists"
             )
 
-        return super().save(**attrs)
+        try:
+            with transaction.atomic():
+                return super().save(**attrs)
+        except IntegrityError as exc:
+            if not self._tag_exists(name, user_id):
+                # some other constraint failed (e.g. invalid user_id)
+                raise
+            # same tag was created concurrently by another request
+            raise serializers.ValidationError(
+                f"Tag with name='{name}' already exists"
+            ) from exc
+
+    def _tag_exists(self, name, user_id):
+        # (name, user) is unique together i.e. this is an index only lookup
+        return Tag.objects.filter(name=name, user_id=user_id).exists()
 
 
 class ColoredTagListSerializerField(TagListSerializerField):
@@ -47,7 +47,7 @@ def delete_files(sender, instance: Document, **kwargs):
             )
 
 
-def node_post_save(sender, node, created, *kwargs):
+def node_post_save(sender, node, created, update_fields=None):
     if created:
         # New node instance was created.
         # Create associated Access Model:
@@ -80,6 +80,11 @@ def node_post_save(sender, node, created, *kwargs):
     # parent (X_margaret_fld). Thus, just by copying it,
     # X.pdf becomes margaret private doc - and uploader
     # lose its access to it.
+    if update_fields and not {'parent', 'parent_id'} & set(update_fields):
+        # node was saved without being moved e.g. it was just renamed,
+        # its access permissions stay the same.
+        return
+
     if node.parent:  # current node has a parent?
         # Following statement covers case when node
         # is moved from one parent to another parent.
@@ -103,12 +108,22 @@ def node_post_save(sender, node, created, *kwargs):
 
 @receiver(post_save, sender=Folder)
 def save_node_folder(sender, instance, created, **kwargs):
-    node_post_save(sender, instance, created, kwargs)
+    node_post_save(
+        sender,
+        instance,
+        created,
+        update_fields=kwargs.get('update_fields')
+    )
 
 
 @receiver(post_save, sender=Document)
 def save_node_doc(sender, instance, created, **kwargs):
-    node_post_save(sender, instance, created, kwargs)
+    node_post_save(
+        sender,
+        instance,
+        created,
+        update_fields=kwargs.get('update_fields')
+    )
 
 
 @receiver(post_save, sender=Document)
@@ -1,5 +1,6 @@
 import logging
 
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.response import Response
@@ -39,15 +40,21 @@ class DocumentUploadView(RequireAuthMixin, APIView):
         specify ``Content-Disposition`` header with value
         'attachment; filename={file_name}'.
         """
+        # Stream uploaded file in chunks into a temporary file, regardless
+        # of its size and of FILE_UPLOAD_HANDLERS setting. This way the
+        # payload is never held in memory as a whole and it always has
+        # a temporary file path.
+        request.upload_handlers = [TemporaryFileUploadHandler(request)]
         payload = request.data['file']
-        user_settings = request.user.preferences
+        user_settings = request.user.prefs
         namespace = getattr(get_storage_instance(), 'namespace', None)
 
         doc = Document.objects.get(pk=document_id)
         doc.upload(
             payload=payload,
             file_path=payload.temporary_file_path(),
-            file_name=file_name
+            file_name=file_name,
+            link=True
         )
 
         if user_settings['ocr__trigger'] == 'auto':
@@ -42,6 +42,21 @@ logger = logging.getLogger(__name__)
 
 PER_PAGE = 30
 
+# Columns needed to serialize listed nodes (see NodeSerializer and
+# its polymorphic serializers). Fields of node subclasses are referenced
+# with django-polymorphic's ``Model___field`` syntax.
+NODE_LIST_FIELDS = (
+    'id',
+    'polymorphic_ctype',
+    'parent',
+    'title',
+    'lang',
+    'created_at',
+    'updated_at',
+    'Document___ocr',
+    'Document___ocr_status',
+)
+
 
 class NodesViewSet(RequireAuthMixin, ModelViewSet):
     """
@@ -52,6 +67,9 @@ class NodesViewSet(RequireAuthMixin, ModelViewSet):
     """
     serializer_class = NodeSerializer
     queryset = BaseTreeNode.objects.all()
+    # Fields nodes can be sorted by e.g. ?sort=-title
+    # Any other sort field is rejected with 400 Bad Request.
+    ordering_fields = ('title', 'created_at', 'updated_at')
     # object level permissions
     access_object_permissions = {
         'retrieve': Access.PERM_READ,
@@ -63,7 +81,9 @@ class NodesViewSet(RequireAuthMixin, ModelViewSet):
         operation_id="Retrieve Node",
     )
     def retrieve(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.filter_queryset(
+            self.get_queryset()
+        ).only(*NODE_LIST_FIELDS)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
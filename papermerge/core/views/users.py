@@ -25,6 +25,22 @@ class UsersViewSet(RequireAuthMixin, ModelViewSet):
     renderer_classes = (JSONAPIRenderer,)
     permission_classes = [CustomModelPermissions]
 
+    def get_queryset(self, *args, **kwargs):
+        queryset = super().get_queryset(*args, **kwargs).select_related(
+            'home_folder',
+            'inbox_folder'
+        ).order_by('username')
+
+        if self.action == 'list':
+            # fetch only columns rendered by UserSerializer
+            queryset = queryset.only(
+                *UserSerializer.Meta.fields,
+                'home_folder__id',
+                'inbox_folder__id'
+            )
+
+        return queryset
+
 
 class UserChangePassword(RequireAuthMixin, GenericAPIView):
     parser_classes = [JSONParser]
@@ -33,10 +49,10 @@ class UserChangePassword(RequireAuthMixin, GenericAPIView):
 
     def post(self, request, pk):
         serializer = PasswordSerializer(data=request.data)
-        user = User.objects.get(pk=pk)
         if serializer.is_valid():
+            user = User.objects.only('id', 'password').get(pk=pk)
             user.set_password(serializer.validated_data['password'])
-            user.save()
+            user.save(update_fields=['password', 'updated_at'])
             return Response({'status': 'password set'})
         else:
             return Response(
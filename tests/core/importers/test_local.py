@@ -0,0 +1,109 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from papermerge.core.import_pipeline import LOCAL
+from papermerge.core.importers.local import import_documents
+
+
+@override_settings(PAPERMERGE_FILES_MIN_UNMODIFIED_DURATION=0)
+class TestLocalImporter(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_file(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        return path
+
+    def import_documents(self, modify=None):
+        """
+        Runs ``import_documents`` on test directory. ``modify`` is called
+        between scan of the directory and consuming of the files, i.e.
+        while importer waits for files to stay unmodified.
+        """
+        def sleep(seconds):
+            if modify is not None:
+                modify()
+
+        with mock.patch(
+            'papermerge.core.importers.local.go_through_pipelines',
+            return_value=mock.Mock()
+        ) as go_through_pipelines, mock.patch(
+            'papermerge.core.importers.local.time.sleep',
+            side_effect=sleep
+        ):
+            import_documents(self.directory.name, skip_ocr=True)
+
+        return go_through_pipelines
+
+    def test_unmodified_file_is_imported(self):
+        path = self.make_file('invoice.pdf', b'%PDF-1.4 content')
+
+        go_through_pipelines = self.import_documents()
+
+        go_through_pipelines.assert_called_once_with(
+            {
+                'payload': b'%PDF-1.4 content',
+                'processor': LOCAL,
+                'name': 'invoice.pdf'
+            },
+            {
+                'user': None,
+                'name': 'invoice.pdf',
+                'skip_ocr': True
+            }
+        )
+        # imported file is removed
+        assert not os.path.exists(path)
+
+    def test_file_with_changed_size_is_skipped(self):
+        path = self.make_file('invoice.pdf', b'%PDF-1.4 content')
+
+        def modify():
+            with open(path, 'ab') as f:
+                f.write(b' still being written')
+
+        go_through_pipelines = self.import_documents(modify=modify)
+
+        go_through_pipelines.assert_not_called()
+        assert os.path.exists(path)
+
+    def test_file_with_changed_mtime_is_skipped(self):
+        path = self.make_file('invoice.pdf', b'%PDF-1.4 content')
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        def modify():
+            # same size, different content and modification time
+            with open(path, 'r+b') as f:
+                f.write(b'%PDF-1.5')
+            os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        go_through_pipelines = self.import_documents(modify=modify)
+
+        go_through_pipelines.assert_not_called()
+        assert os.path.exists(path)
+
+    def test_only_unmodified_files_are_imported(self):
+        unmodified = self.make_file('invoice.pdf', b'%PDF-1.4 content')
+        modified = self.make_file('receipt.pdf', b'%PDF-1.4 content')
+
+        def modify():
+            with open(modified, 'ab') as f:
+                f.write(b' still being written')
+
+        go_through_pipelines = self.import_documents(modify=modify)
+
+        assert go_through_pipelines.call_count == 1
+        init_kwargs = go_through_pipelines.call_args[0][0]
+        assert init_kwargs['name'] == 'invoice.pdf'
+        assert not os.path.exists(unmodified)
+        assert os.path.exists(modified)
@@ -0,0 +1,67 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from papermerge.core.lib.storage import Storage
+
+
+class TestStorageLinkDoc(unittest.TestCase):
+
+    def setUp(self):
+        self.location = tempfile.TemporaryDirectory()
+        self.storage = Storage(location=self.location.name)
+        self.src = os.path.join(self.location.name, 'src.pdf')
+        with open(self.src, 'wb') as f:
+            f.write(b'%PDF-1.4 content')
+        # mode of temporary files
+        os.chmod(self.src, 0o600)
+
+    def tearDown(self):
+        self.location.cleanup()
+
+    def test_link_doc(self):
+        dst = 'docs/user_1/document_1/src.pdf'
+
+        self.storage.link_doc(src=self.src, dst=dst)
+        # source file is temporary and removed afterwards
+        os.remove(self.src)
+
+        with open(self.storage.abspath(dst), 'rb') as f:
+            assert f.read() == b'%PDF-1.4 content'
+
+    def test_link_doc_falls_back_to_copy(self):
+        dst = 'docs/user_1/document_1/src.pdf'
+
+        with mock.patch('os.link', side_effect=OSError):
+            self.storage.link_doc(src=self.src, dst=dst)
+
+        assert not os.path.samefile(self.src, self.storage.abspath(dst))
+        with open(self.storage.abspath(dst), 'rb') as f:
+            assert f.read() == b'%PDF-1.4 content'
+
+    def test_link_doc_given_file_mode(self):
+        dst = 'docs/user_1/document_1/src.pdf'
+
+        self.storage.link_doc(
+            src=self.src,
+            dst=dst,
+            file_permissions_mode=0o640
+        )
+
+        mode = os.stat(self.storage.abspath(dst)).st_mode
+        assert stat.S_IMODE(mode) == 0o640
+
+    def test_link_doc_fallback_file_mode(self):
+        dst = 'docs/user_1/document_1/src.pdf'
+
+        with mock.patch('os.link', side_effect=OSError):
+            self.storage.link_doc(
+                src=self.src,
+                dst=dst,
+                file_permissions_mode=0o640
+            )
+
+        mode = os.stat(self.storage.abspath(dst)).st_mode
+        assert stat.S_IMODE(mode) == 0o640
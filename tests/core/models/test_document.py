@@ -1,7 +1,11 @@
 import os
 import shutil
+import stat
 from pathlib import Path
 
+from django.core.files.temp import NamedTemporaryFile
+from django.test import override_settings
+
 from papermerge.core.storage import abs_path
 from papermerge.test import TestCase
 from papermerge.core.models import (User, Document)
@@ -142,6 +146,47 @@ class TestDocumentModel(TestCase):
         )
 
         payload.close()
+        # file of caller is copied, not shared with the storage
+        assert not os.path.samefile(
+            self.resources / 'three-pages.pdf',
+            abs_path(last_version.document_path)
+        )
+
+    def test_upload_link(self):
+        """
+        Temporary file owned by the caller is hard linked into
+        the storage and gets mode of regular uploaded file
+        """
+        doc = Document.objects.create_document(
+            title="three-pages.pdf",
+            lang="deu",
+            user_id=self.user.pk,
+            parent=self.user.home_folder
+        )
+        temp = NamedTemporaryFile()
+        with open(self.resources / 'three-pages.pdf', 'rb') as f:
+            temp.write(f.read())
+        temp.flush()
+        temp.seek(0)
+        # NamedTemporaryFile is created with 0o600 mode
+        assert stat.S_IMODE(os.stat(temp.name).st_mode) == 0o600
+
+        with override_settings(FILE_UPLOAD_PERMISSIONS=0o644):
+            doc.upload(
+                payload=temp,
+                file_path=temp.name,
+                file_name='three-pages.pdf',
+                link=True
+            )
+
+        last_version = doc.versions.last()
+        stored_path = abs_path(last_version.document_path)
+        assert os.path.samefile(temp.name, stored_path)
+        assert stat.S_IMODE(os.stat(stored_path).st_mode) == 0o644
+        assert last_version.page_count == 3
+
+        temp.close()
+        assert os.path.exists(stored_path)
 
     def test_version_bump_from_pages(self):
         """
@@ -1,5 +1,5 @@
 from papermerge.test import TestCase
-from papermerge.core.models import User, Folder
+from papermerge.core.models import User, Folder, Document, BaseTreeNode
 
 
 class TestFolderModel(TestCase):
@@ -51,3 +51,69 @@ class TestFolderModel(TestCase):
             parent=self.user.inbox_folder
         )
         assert self.user.inbox_folder.children.count() == 1
+
+    def test_delete_nodes_together_with_their_descendants(self):
+        """
+        Deleting a queryset which contains both a folder and some of its
+        descendants deletes whole subtree and keeps the tree consistent.
+        """
+        home = self.user.home_folder
+        folder_a = Folder.objects.create(
+            title='A', user=self.user, parent=home
+        )
+        folder_b = Folder.objects.create(
+            title='B', user=self.user, parent=folder_a
+        )
+        Document.objects.create_document(
+            title='doc1.pdf', lang='deu', user_id=self.user.pk,
+            parent=folder_b
+        )
+        doc2 = Document.objects.create_document(
+            title='doc2.pdf', lang='deu', user_id=self.user.pk,
+            parent=folder_a
+        )
+        folder_c = Folder.objects.create(
+            title='C', user=self.user, parent=home
+        )
+
+        BaseTreeNode.objects.filter(
+            id__in=[folder_a.id, folder_b.id, doc2.id]
+        ).delete()
+
+        home.refresh_from_db()
+        assert Document.objects.filter(user=self.user).count() == 0
+        assert list(home.get_descendants()) == [folder_c]
+        assert home.rght - home.lft == 3
+
+        # deleting topmost nodes shifts (lft, rght) of the nodes which
+        # follow them; descendants of deleted nodes must still be skipped
+        user = User.objects.create_user(username="user2")
+        home = user.home_folder
+        folders_a = [
+            Folder.objects.create(title=f'A{i}', user=user, parent=home)
+            for i in range(1, 4)
+        ]
+        folder_b = Folder.objects.create(
+            title='B', user=user, parent=home
+        )
+        doc_c = Document.objects.create_document(
+            title='C.pdf', lang='deu', user_id=user.pk,
+            parent=folder_b
+        )
+        folders_d = [
+            Folder.objects.create(title=f'D{i}', user=user, parent=home)
+            for i in range(1, 11)
+        ]
+
+        BaseTreeNode.objects.filter(
+            id__in=[node.id for node in folders_a] + [folder_b.id, doc_c.id]
+        ).delete()
+
+        home.refresh_from_db()
+        assert Document.objects.filter(user=user).count() == 0
+        assert list(home.get_descendants()) == folders_d
+        assert (home.lft, home.rght) == (1, 22)
+        for index, folder in enumerate(folders_d):
+            folder.refresh_from_db()
+            assert folder.lft == 2 + 2 * index
+            assert folder.rght == folder.lft + 1
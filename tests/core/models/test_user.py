@@ -18,3 +18,14 @@ class TestUserModel(TestCase):
         # make sure that deleting user without any nodes associated does not
         # raise any exception
         user.delete()
+
+    def test_user_prefs(self):
+        user = baker.make('core.user')
+        user.preferences['ocr__language'] = 'eng'
+
+        prefs = user.prefs
+
+        assert prefs['ocr__language'] == 'eng'
+        assert 'localization__timezone' in prefs
+        # preferences are memoized on the user instance
+        assert user.prefs is prefs
@@ -1,8 +1,27 @@
+import re
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from papermerge.test import TestCase
-from papermerge.core.models import User, Folder
+from papermerge.core.auth import create_access
+from papermerge.core.models import Access, User, Folder
 from papermerge.core.serializers import FolderSerializer
 
 
+def updated_columns(captured_queries):
+    """
+    Returns list of column names set by each UPDATE statement
+    """
+    result = []
+    for query in captured_queries:
+        match = re.match(r'UPDATE "\w+" SET (.*) WHERE ', query['sql'])
+        if match:
+            result.append(re.findall(r'"(\w+)" = ', match.group(1)))
+
+    return result
+
+
 class TestFolderSerializer(TestCase):
 
     def setUp(self):
@@ -42,3 +61,175 @@ class TestFolderSerializer(TestCase):
         assert serializer.data
         assert serializer.data['id']
         assert len(serializer.data['tags']) == 2
+
+    def test_folder_rename(self):
+        folder = Folder.objects.create(
+            title='My Documents',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        data = {
+            'id': folder.pk,
+            'type': 'folders',
+            'title': 'Invoices'
+        }
+        serializer = FolderSerializer(
+            instance=folder,
+            data=data,
+            partial=True
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+
+        # only changed column is written
+        assert updated_columns(ctx.captured_queries) == [
+            ['title', 'updated_at']
+        ]
+        folder.refresh_from_db()
+        assert folder.title == 'Invoices'
+        assert folder.parent == self.user.home_folder
+
+    def test_folder_move(self):
+        folder = Folder.objects.create(
+            title='My Documents',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        target = Folder.objects.create(
+            title='Archive',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        data = {
+            'id': folder.pk,
+            'type': 'folders',
+            'parent': {
+                'type': 'folders',
+                'id': target.pk
+            }
+        }
+        serializer = FolderSerializer(
+            instance=folder,
+            data=data,
+            partial=True
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+
+        # besides tree (MPTT) bookkeeping, only parent_id is written
+        assert ['parent_id', 'updated_at'] in updated_columns(
+            ctx.captured_queries
+        )
+        assert ['title', 'updated_at'] not in updated_columns(
+            ctx.captured_queries
+        )
+        folder.refresh_from_db()
+        target.refresh_from_db()
+        assert folder.title == 'My Documents'
+        assert folder.parent == target
+        assert folder in target.get_children()
+        assert folder not in self.user.home_folder.get_children()
+
+    def test_folder_update_without_changes(self):
+        folder = Folder.objects.create(
+            title='My Documents',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        data = {
+            'id': folder.pk,
+            'type': 'folders',
+            'title': 'My Documents',
+            'parent': {
+                'type': 'folders',
+                'id': self.user.home_folder.pk
+            }
+        }
+        serializer = FolderSerializer(
+            instance=folder,
+            data=data,
+            partial=True
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save()
+
+        # nothing changed, thus nothing is written
+        assert updated_columns(ctx.captured_queries) == []
+
+    def test_folder_update_with_user_id(self):
+        """
+        Attributes passed to ``save`` as raw column values
+        (e.g. user_id) are compared as such
+        """
+        folder = Folder.objects.create(
+            title='My Documents',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        serializer = FolderSerializer(
+            instance=folder,
+            data={
+                'id': folder.pk,
+                'type': 'folders',
+                'title': 'Invoices'
+            },
+            partial=True
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save(user_id=self.user.pk)
+
+        assert updated_columns(ctx.captured_queries) == [
+            ['title', 'updated_at']
+        ]
+        folder.refresh_from_db()
+        assert folder.title == 'Invoices'
+        assert folder.user == self.user
+
+    def test_folder_move_by_parent_id(self):
+        """
+        Node moved by passing raw ``parent_id`` to ``save`` inherits
+        access permissions of its new parent
+        """
+        margaret = User.objects.create(username='margaret')
+        folder = Folder.objects.create(
+            title='My Documents',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        target = Folder.objects.create(
+            title='Shared',
+            user=self.user,
+            parent=self.user.home_folder
+        )
+        create_access(
+            node=target,
+            model_type=Access.MODEL_USER,
+            name=margaret.username,
+            access_type=Access.ALLOW,
+            access_inherited=False,
+            permissions={Access.PERM_READ: True}
+        )
+        serializer = FolderSerializer(
+            instance=folder,
+            data={'id': folder.pk, 'type': 'folders'},
+            partial=True
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as ctx:
+            serializer.save(parent_id=target.pk)
+
+        assert ['parent_id', 'updated_at'] in updated_columns(
+            ctx.captured_queries
+        )
+        folder.refresh_from_db()
+        assert folder.parent == target
+        assert folder.access_set.filter(user=margaret).exists()
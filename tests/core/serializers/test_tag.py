@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from rest_framework.serializers import ModelSerializer
+
+from papermerge.test import TestCase
+from papermerge.core.models import Tag
+from papermerge.core.serializers import TagSerializer
+
+
+class TestTagSerializer(TestCase):
+
+    def test_basic_serialization(self):
+        serializer = TagSerializer(data={'name': 'paid'})
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save(user_id=self.user.pk)
+
+        assert Tag.objects.filter(name='paid', user=self.user).exists()
+
+    def test_integrity_error_other_than_duplicate_is_raised(self):
+        """
+        Failed insert is reported as duplicate tag only if the tag
+        really exists
+        """
+        serializer = TagSerializer(data={'name': 'paid'})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with patch.object(
+            ModelSerializer,
+            'save',
+            side_effect=IntegrityError('FOREIGN KEY constraint failed')
+        ):
+            with self.assertRaises(IntegrityError):
+                serializer.save(user_id=self.user.pk)
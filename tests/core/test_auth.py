@@ -0,0 +1,130 @@
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from papermerge.core.auth import NodeAuthBackend, create_access
+from papermerge.core.models import Access, Folder, User
+
+
+def count_user_groups_queries(captured_queries):
+    return len([
+        query for query in captured_queries
+        if '"core_user_groups"' in query['sql']
+    ])
+
+
+class TestNodeAuthBackendGroupAccess(TestCase):
+
+    def setUp(self):
+        self.backend = NodeAuthBackend()
+        self.owner = User.objects.create_user(username='owner')
+        self.member = User.objects.create_user(username='member')
+        self.non_member = User.objects.create_user(username='non_member')
+        self.group = Group.objects.create(name='employee')
+        self.member.groups.add(self.group)
+        self.folder = Folder.objects.create(
+            title='Invoices',
+            user=self.owner,
+            parent=self.owner.home_folder
+        )
+        create_access(
+            node=self.folder,
+            model_type=Access.MODEL_GROUP,
+            access_type=Access.ALLOW,
+            name=self.group.name,
+            permissions={
+                Access.PERM_READ: True,
+                Access.PERM_WRITE: True
+            },
+            access_inherited=False
+        )
+
+    def test_group_member_gets_group_permissions(self):
+        perms = self.backend._get_group_permissions(
+            self.member, self.folder, Access.ALLOW
+        )
+
+        assert perms == {Access.PERM_READ, Access.PERM_WRITE}
+        assert self.backend.has_perm(
+            self.member, Access.PERM_READ, self.folder
+        )
+        assert not self.backend.has_perm(
+            self.member, Access.PERM_DELETE, self.folder
+        )
+
+    def test_group_member_gets_group_permissions_for_list(self):
+        perms = self.backend._get_group_permissions(
+            self.member, [self.folder], Access.ALLOW
+        )
+
+        assert perms == {
+            self.folder.id: {Access.PERM_READ, Access.PERM_WRITE}
+        }
+
+    def test_non_member_does_not_get_group_permissions(self):
+        perms = self.backend._get_group_permissions(
+            self.non_member, self.folder, Access.ALLOW
+        )
+        perms_dict = self.backend._get_group_permissions(
+            self.non_member, [self.folder], Access.ALLOW
+        )
+
+        assert perms == set()
+        assert perms_dict == {}
+        assert not self.backend.has_perm(
+            self.non_member, Access.PERM_READ, self.folder
+        )
+
+    def test_access_without_group_is_ignored(self):
+        """
+        User access entries (i.e. the ones with group=None) do not grant
+        group permissions, not even to users without any group
+        """
+        # owner's access entry, created for the folder on its creation
+        assert self.folder.access_set.filter(
+            group=None,
+            user=self.owner
+        ).exists()
+
+        perms = self.backend._get_group_permissions(
+            self.owner, self.folder, Access.ALLOW
+        )
+        perms_dict = self.backend._get_group_permissions(
+            self.owner, [self.folder], Access.ALLOW
+        )
+
+        assert perms == set()
+        assert perms_dict == {}
+
+    def test_user_groups_are_fetched_once(self):
+        """
+        ``has_perm`` checks both deny and allow access entries, IDs
+        of user's groups are fetched only once
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            assert self.backend.has_perm(
+                self.member, Access.PERM_READ, self.folder
+            )
+            assert self.backend.has_perm(
+                self.member, Access.PERM_WRITE, self.folder
+            )
+
+        assert count_user_groups_queries(ctx.captured_queries) == 1
+
+    def test_user_groups_are_not_fetched_without_group_access(self):
+        """
+        User groups are not queried when node has no group access entries
+        """
+        folder = Folder.objects.create(
+            title='Receipts',
+            user=self.owner,
+            parent=self.owner.home_folder
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert self.backend.has_perm(
+                self.owner, Access.PERM_READ, folder
+            )
+
+        assert count_user_groups_queries(ctx.captured_queries) == 0
@@ -0,0 +1,369 @@
+import io
+import os
+import shutil
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
+from django.core.files.temp import NamedTemporaryFile
+from django.test import TestCase, override_settings
+
+from papermerge.core.exceptions import FileTypeNotSupported
+from papermerge.core.import_pipeline import (
+    LOCAL,
+    DefaultPipeline,
+    clear_user_properties_cache,
+    go_through_pipelines
+)
+from papermerge.core.models import Document, User
+from papermerge.core.storage import abs_path
+
+TEST_DIR_ABS_PATH = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+RESOURCES = Path(TEST_DIR_ABS_PATH) / 'resources'
+
+MIMETYPES = [
+    'application/octet-stream',
+    'application/pdf',
+    'image/png',
+    'image/jpeg',
+    'image/jpg',
+    'image/tiff'
+]
+
+
+def read_resource(name):
+    with open(RESOURCES / name, 'rb') as f:
+        return f.read()
+
+
+def make_image(image_format):
+    buffer = io.BytesIO()
+    Image.new('RGB', (1, 1)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def read_stored_file(document_version):
+    with open(abs_path(document_version.document_path.url), 'rb') as f:
+        return f.read()
+
+
+@override_settings(PAPERMERGE_MIMETYPES=MIMETYPES)
+class TestPipelineMimetype(TestCase):
+
+    def test_pdf_payload_is_accepted(self):
+        pipeline = DefaultPipeline(
+            payload=read_resource('three-pages.pdf'),
+            name='three-pages.pdf'
+        )
+
+        assert pipeline.mimetype == 'application/pdf'
+
+    def test_supported_mimetypes_are_read_from_current_settings(self):
+        with override_settings(PAPERMERGE_MIMETYPES=['image/png']):
+            with self.assertRaises(FileTypeNotSupported):
+                DefaultPipeline(
+                    payload=read_resource('three-pages.pdf'),
+                    name='three-pages.pdf'
+                )
+
+    def test_misnamed_payload_is_rejected(self):
+        """
+        Mimetype guessed from file name is not trusted when payload
+        content does not match it
+        """
+        for name in ('evil.pdf', 'evil.png', 'evil.bin'):
+            with self.assertRaises(FileTypeNotSupported):
+                DefaultPipeline(
+                    payload=b'hello world not a pdf',
+                    name=name
+                )
+
+    def test_pdf_payload_with_wrong_extension(self):
+        """
+        Mimetype of payload is detected from its content when
+        file name does not match it
+        """
+        pipeline = DefaultPipeline(
+            payload=read_resource('three-pages.pdf'),
+            name='three-pages.png'
+        )
+
+        assert pipeline.mimetype == 'application/pdf'
+
+
+@override_settings(
+    PAPERMERGE_MIMETYPES=MIMETYPES,
+    PAPERMERGE_PIPELINES=[
+        'papermerge.core.import_pipeline.DefaultPipeline'
+    ]
+)
+class TestPipelineApply(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='user1')
+        self.media = Path(TEST_DIR_ABS_PATH) / 'media'
+        shutil.rmtree(self.media / 'docs', ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.media / 'docs', ignore_errors=True)
+
+    def test_named_bytes_payload(self):
+        """
+        Bytes payload with known page count is stored without
+        being written to temporary file
+        """
+        payload = read_resource('three-pages.pdf')
+        pipeline = DefaultPipeline(
+            payload=payload,
+            name='three-pages.pdf',
+            processor=LOCAL
+        )
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert pipeline.mimetype == 'application/pdf'
+        assert pipeline._path is None
+        assert pipeline._temp is None
+        assert doc.title == 'three-pages.pdf'
+        assert doc.parent_id == self.user.inbox_folder_id
+        document_version = doc.versions.last()
+        assert document_version.file_name == 'three-pages.pdf'
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 3
+        assert document_version.pages.count() == 3
+        assert read_stored_file(document_version) == payload
+
+    def test_unnamed_bytes_payload(self):
+        """
+        Document name is taken from temporary file which is removed
+        once the payload was stored
+        """
+        payload = read_resource('three-pages.pdf')
+        pipeline = DefaultPipeline(payload=payload, processor=LOCAL)
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        temp_path = pipeline._path
+        assert doc.title == os.path.basename(temp_path)
+        assert not os.path.exists(temp_path)
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 3
+        assert read_stored_file(document_version) == payload
+
+    def test_png_bytes_payload(self):
+        payload = make_image('PNG')
+        pipeline = DefaultPipeline(
+            payload=payload,
+            name='receipt.png',
+            processor=LOCAL
+        )
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert pipeline.mimetype == 'image/png'
+        assert pipeline._path is None
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 1
+        assert read_stored_file(document_version) == payload
+
+    def test_tiff_bytes_payload(self):
+        """
+        Page count of TIFF is found by external utility, thus
+        payload is written to temporary file first
+        """
+        payload = make_image('TIFF')
+        pipeline = DefaultPipeline(
+            payload=payload,
+            name='scan.tiff',
+            processor=LOCAL
+        )
+
+        def tiff_pagecount(filepath):
+            with open(filepath, 'rb') as f:
+                assert f.read() == payload
+            return 2
+
+        with mock.patch(
+            'papermerge.core.lib.pagecount._get_tiff_pagecount',
+            side_effect=tiff_pagecount
+        ):
+            doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert pipeline.mimetype == 'image/tiff'
+        assert not os.path.exists(pipeline._path)
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 2
+        assert read_stored_file(document_version) == payload
+
+    def test_temporary_file_payload(self):
+        payload = read_resource('three-pages.pdf')
+        temp = NamedTemporaryFile()
+        temp.write(payload)
+        temp.flush()
+        pipeline = DefaultPipeline(
+            payload=temp,
+            name='three-pages.pdf',
+            processor=LOCAL
+        )
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert pipeline.path == temp.name
+        # payload is closed i.e. temporary file is removed
+        assert not os.path.exists(temp.name)
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 3
+        assert read_stored_file(document_version) == payload
+
+    def test_go_through_pipelines(self):
+        doc = go_through_pipelines(
+            init_kwargs={
+                'payload': read_resource('three-pages.pdf'),
+                'processor': LOCAL,
+                'name': 'three-pages.pdf'
+            },
+            apply_kwargs={
+                'user': self.user,
+                'name': 'three-pages.pdf',
+                'skip_ocr': True
+            }
+        )
+
+        assert doc.title == 'three-pages.pdf'
+        assert doc.versions.last().page_count == 3
+
+    def test_go_through_pipelines_with_unsupported_payload(self):
+        doc = go_through_pipelines(
+            init_kwargs={
+                'payload': b'hello world not a pdf',
+                'processor': LOCAL,
+                'name': 'evil.pdf'
+            },
+            apply_kwargs={
+                'user': self.user,
+                'name': 'evil.pdf',
+                'skip_ocr': True
+            }
+        )
+
+        assert doc is None
+
+
+@override_settings(PAPERMERGE_MIMETYPES=MIMETYPES)
+class TestPipelineUpdateDocument(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='user1')
+        self.doc = Document.objects.create_document(
+            user_id=self.user.pk,
+            title='three-pages.pdf',
+            lang='deu',
+            file_name='three-pages.pdf',
+            parent_id=self.user.home_folder_id
+        )
+        self.media = Path(TEST_DIR_ABS_PATH) / 'media'
+        shutil.rmtree(self.media / 'docs', ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.media / 'docs', ignore_errors=True)
+
+    def test_bytes_payload(self):
+        """
+        Bytes payload is stored as version of existing document
+        without being written to temporary file
+        """
+        payload = read_resource('three-pages.pdf')
+        pipeline = DefaultPipeline(
+            payload=payload,
+            doc=self.doc,
+            name='three-pages.pdf',
+            processor=LOCAL
+        )
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert doc == self.doc
+        assert pipeline._path is None
+        # zero sized document version was reused
+        assert doc.versions.count() == 1
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 3
+        assert document_version.pages.count() == 3
+        assert read_stored_file(document_version) == payload
+
+    def test_temporary_file_payload(self):
+        payload = read_resource('three-pages.pdf')
+        temp = NamedTemporaryFile()
+        temp.write(payload)
+        temp.flush()
+        pipeline = DefaultPipeline(
+            payload=temp,
+            doc=self.doc,
+            name='three-pages.pdf',
+            processor=LOCAL
+        )
+
+        doc = pipeline.apply(user=self.user, skip_ocr=True)
+
+        assert not os.path.exists(temp.name)
+        document_version = doc.versions.last()
+        assert document_version.size == len(payload)
+        assert document_version.page_count == 3
+        assert read_stored_file(document_version) == payload
+
+    def test_image_payload_is_rejected(self):
+        """
+        Only PDF payload can be stored as version of existing document
+        """
+        with self.assertRaises(FileTypeNotSupported):
+            DefaultPipeline(
+                payload=make_image('PNG'),
+                doc=self.doc,
+                name='receipt.png',
+                processor=LOCAL
+            )
+
+
+class TestPipelineUserProperties(TestCase):
+
+    def setUp(self):
+        clear_user_properties_cache()
+
+    def test_missing_superuser_is_not_cached(self):
+        with self.assertRaises(User.DoesNotExist):
+            DefaultPipeline.get_user_properties(None)
+
+        superuser = User.objects.create_user(
+            username='admin',
+            is_superuser=True
+        )
+        user, _, inbox_id = DefaultPipeline.get_user_properties(None)
+
+        assert user == superuser
+        assert inbox_id == superuser.inbox_folder_id
+
+    def test_clear_user_properties_cache(self):
+        """
+        Users changed without post_save signal (e.g. by another process)
+        are picked up once cache is cleared
+        """
+        admin1 = User.objects.create_user(
+            username='admin1',
+            is_superuser=True
+        )
+        admin2 = User.objects.create_user(username='admin2')
+        assert DefaultPipeline.get_user_properties(None)[0] == admin1
+
+        User.objects.filter(pk=admin1.pk).update(is_superuser=False)
+        User.objects.filter(pk=admin2.pk).update(is_superuser=True)
+        assert DefaultPipeline.get_user_properties(None)[0] == admin1
+
+        clear_user_properties_cache()
+        assert DefaultPipeline.get_user_properties(None)[0] == admin2
@@ -3,7 +3,7 @@ import os
 import shutil
 from pathlib import Path
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
@@ -62,6 +62,38 @@ class DocumentUploadViewTestCase(TestCase):
 
         file.close()
 
+    @override_settings(FILE_UPLOAD_HANDLERS=[
+        'django.core.files.uploadhandler.MemoryFileUploadHandler'
+    ])
+    def test_document_upload_view_streams_to_temporary_file(self):
+        """
+        Uploaded file is written to temporary file even if
+        project settings would keep it in memory
+        """
+        doc = Document.objects.create_document(
+            title="three-pages.pdf",
+            lang="deu",
+            user_id=self.user.pk,
+            parent=self.user.home_folder
+        )
+        url = reverse('documents_upload', kwargs={
+            'document_id': doc.pk,
+            'file_name': 'three-pages.pdf'
+        })
+        self.user.preferences['ocr__trigger'] = 'manual'
+
+        with open(self.resources / 'three-pages.pdf', 'rb') as file:
+            response = self.client.put(
+                url,
+                {"file": file},
+                format='multipart',
+                HTTP_CONTENT_DISPOSITION="attachment; "
+                "filename=three-pages.pdf"
+            )
+
+        assert response.status_code == 201
+        assert doc.versions.last().pages.count() == 3
+
 
 class DocumentViewTest(TestCase):
     def setUp(self):
@@ -51,6 +51,30 @@ class NodesViewTestCase(TestCase):
         # user's inbox contains one item
         assert response.data == {'count': 1}
 
+    def test_retrieve_nodes_sorted_by_title(self):
+        for title in ('b', 'c', 'a'):
+            Folder.objects.create(
+                title=title,
+                user=self.user,
+                parent=self.user.home_folder
+            )
+        url = reverse('node-detail', args=(self.user.home_folder.pk, ))
+
+        response = self.client.get(url, {'sort': '-title'})
+
+        assert response.status_code == 200
+        titles = [item['title'] for item in response.data['results']]
+        assert titles == ['c', 'b', 'a']
+
+    def test_retrieve_nodes_sorted_by_not_allowed_field(self):
+        url = reverse('node-detail', args=(self.user.home_folder.pk, ))
+
+        # model fields which are not whitelisted for sorting
+        for sort in ('id', 'parent', '-parent'):
+            response = self.client.get(url, {'sort': sort})
+
+            assert response.status_code == 400, sort
+
     def test_assign_tags_to_non_tagged_folder(self):
         """
         url:
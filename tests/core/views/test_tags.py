@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.urls import reverse
@@ -8,6 +9,7 @@ from papermerge.core.models import (
     User,
     Tag
 )
+from papermerge.core.serializers import TagSerializer
 
 
 class TagsViewTestCase(TestCase):
@@ -77,3 +79,34 @@ class TagsViewTestCase(TestCase):
         assert response.status_code == 400, response.data
         assert 'already exists' in response.data[0]['detail']
         assert Tag.objects.count() == 1
+
+    def test_create_concurrently_duplicated_tag(self):
+        """
+        If same tag was created concurrently i.e. after duplicate check
+        passed, 400 validation error is returned as well
+        """
+        Tag.objects.create(name='tag1', user=self.user)
+        tag1 = {
+            'data': {
+                'type': 'tags',
+                'attributes': {
+                    'name': 'tag1'
+                }
+            }
+        }
+        # tag is not found by the duplicate check, but it is found
+        # once insert failed
+        with patch.object(
+            TagSerializer,
+            '_tag_exists',
+            side_effect=[False, True]
+        ):
+            response = self.client.post(
+                reverse('tag-list'),
+                data=json.dumps(tag1),
+                content_type='application/vnd.api+json'
+            )
+
+        assert response.status_code == 400, response.data
+        assert 'already exists' in response.data[0]['detail']
+        assert Tag.objects.count() == 1
@@ -1,3 +1,7 @@
+import re
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from model_bakery import baker
 
@@ -12,6 +16,42 @@ class UsersViewTest(TestCase):
 
         assert response.status_code == 200
 
+    def test_change_password(self):
+        user = baker.make('core.user')
+        response = self.client.post(
+            f'/api/users/{user.pk}/change-password/',
+            {'password': 'new-secret'},
+            format='json'
+        )
+
+        assert response.status_code == 200
+        user.refresh_from_db()
+        assert user.check_password('new-secret')
+
+    def test_change_password_updates_only_password_column(self):
+        user = baker.make('core.user')
+        updated_at = user.updated_at
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                f'/api/users/{user.pk}/change-password/',
+                {'password': 'new-secret'},
+                format='json'
+            )
+
+        assert response.status_code == 200
+        updates = [
+            query['sql'] for query in ctx.captured_queries
+            if query['sql'].startswith('UPDATE')
+        ]
+        assert len(updates) == 1
+        # only password column (and updated_at) is written
+        assert re.search(
+            r' SET "password" = \'[^\']*\', "updated_at" = \'[^\']*\' WHERE ',
+            updates[0]
+        )
+        user.refresh_from_db()
+        assert user.updated_at > updated_at
+
 
 class UsersViewPermissionsTestCase(TestCase):
 
@@ -32,3 +72,27 @@ class UsersViewPermissionsTestCase(TestCase):
         baker.make('core.user')
         response = self.client.get(reverse('user-list'))
         assert response.status_code == 200
+
+    @perms('view_user')
+    def test_view_users_number_of_queries(self):
+        """
+        Number of queries issued by 'user-list' does not depend
+        on number of listed users
+        """
+        url = reverse('user-list')
+        # warm up permissions cache of authenticated user
+        self.client.get(url)
+
+        baker.make('core.user', _quantity=2)
+        # one count query for pagination and one query for users
+        # (with their home and inbox folders)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()['data']) == 3
+
+        baker.make('core.user', _quantity=6)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()['data']) == 9